@@ -1,6 +1,9 @@
 """Bounded, authenticated internal API for the custom JobSpy scrapers."""
 
+import asyncio
+import hashlib
 import hmac
+import json
 import logging
 import multiprocessing
 import os
@@ -9,12 +12,14 @@ import signal
 import threading
 import time
 import uuid
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Optional
 
-from fastapi import BackgroundTasks, Depends, FastAPI, Header, HTTPException, status
-from pydantic import ConfigDict, Field, field_validator, model_validator
+from fastapi import Depends, FastAPI, Header, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import ConfigDict, Field, TypeAdapter, field_validator, model_validator
 
-from jobspy.model import Country, DescriptionFormat, JobType, ScraperInput, Site
+from jobspy.model import Country, DescriptionFormat, JobPost, JobType, ScraperInput, Site
 from jobspy.scrapers.japandev import JapanDev
 from jobspy.scrapers.tokyodev import TokyoDev
 
@@ -22,17 +27,28 @@ from jobspy.scrapers.tokyodev import TokyoDev
 DEFAULT_ALLOWED_SITES = frozenset({"tokyodev", "japandev"})
 DEFAULT_MAX_RESULTS = 25
 DEFAULT_TASK_TTL_SECONDS = 3600
+REDIS_TASK_KEY_PREFIX = "jobspy:task:"
+TASK_EVENT_KEEPALIVE_SECONDS = 15
 
 SCRAPER_MAPPING = {
     Site.TOKYODEV: TokyoDev,
     Site.JAPANDEV: JapanDev,
 }
 
+# Built once so every worker reuses the compiled list serializer.
+JOB_LIST_ADAPTER = TypeAdapter(list[JobPost])
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("api_server")
 app = FastAPI(title="JobScout JobSpy Scraper API")
 JOB_STORE: dict[str, dict[str, Any]] = {}
 JOB_STORE_LOCK = threading.Lock()
+# Event streams waiting for a task to leave "processing", woken from scrape threads.
+TASK_WAITERS: dict[str, list[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+TASK_WAITERS_LOCK = threading.Lock()
+# Request fingerprint -> task id of the identical scrape currently running.
+INFLIGHT_TASKS: dict[str, str] = {}
+INFLIGHT_TASKS_LOCK = threading.Lock()
 
 
 def _positive_int_env(name: str, default: int) -> int:
@@ -53,9 +69,40 @@ def _allowed_sites() -> frozenset[str]:
     return frozenset(configured) if configured else DEFAULT_ALLOWED_SITES
 
 
+def _job_type_lookup() -> dict[str, JobType]:
+    """Map lowercase names and aliases to JobType, keeping the enum's declaration order."""
+    lookup: dict[str, JobType] = {}
+    for job_type in JobType:
+        lookup.setdefault(job_type.name.lower(), job_type)
+        for alias in job_type.value:
+            lookup.setdefault(alias, job_type)
+    return lookup
+
+
+JOB_TYPE_LOOKUP = _job_type_lookup()
+
+
+def _create_task_redis() -> Any:
+    """Connect the optional shared task store used when several API workers run."""
+    redis_url = os.getenv("JOBSPY_REDIS_URL", "").strip()
+    if not redis_url:
+        return None
+    import redis
+
+    return redis.Redis.from_url(redis_url)
+
+
 TASK_TTL_SECONDS = _positive_int_env("JOBSPY_TASK_TTL_SECONDS", DEFAULT_TASK_TTL_SECONDS)
-SCRAPE_SEMAPHORE = threading.BoundedSemaphore(
-    _positive_int_env("JOBSPY_MAX_CONCURRENT_JOBS", 1)
+# With Redis, task state survives restarts and is visible to every uvicorn worker;
+# expiry is delegated to the key TTL. The scrape semaphore remains per process.
+TASK_REDIS = _create_task_redis()
+MAX_CONCURRENT_JOBS = _positive_int_env("JOBSPY_MAX_CONCURRENT_JOBS", 1)
+SCRAPE_SEMAPHORE = threading.BoundedSemaphore(MAX_CONCURRENT_JOBS)
+# Scrape supervisors block for the whole request timeout while their worker process
+# runs, so they get dedicated threads instead of Starlette's shared threadpool.
+SCRAPE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_JOBS,
+    thread_name_prefix="jobspy-scrape",
 )
 
 
@@ -71,19 +118,112 @@ def _cleanup_expired_tasks() -> None:
             JOB_STORE.pop(task_id, None)
 
 
-def _store_task(task_id: str, **values: Any) -> None:
+def _task_key(task_id: str) -> str:
+    return f"{REDIS_TASK_KEY_PREFIX}{task_id}"
+
+
+def _store_task(task_id: str, *, data_json: Optional[bytes] = None, **values: Any) -> None:
+    """Store task state together with its response body, rendered once here."""
+    body = _render_task_json(values, data_json)
+    if TASK_REDIS is not None:
+        key = _task_key(task_id)
+        # MULTI/EXEC so readers never see a body from one state next to another state.
+        pipeline = TASK_REDIS.pipeline(transaction=True)
+        pipeline.set(f"{key}:body", body, ex=TASK_TTL_SECONDS)
+        pipeline.set(key, json.dumps(values), ex=TASK_TTL_SECONDS)
+        pipeline.execute()
+    else:
+        with JOB_STORE_LOCK:
+            JOB_STORE[task_id] = {
+                **values,
+                "_body": body,
+                "_updated_at": time.monotonic(),
+            }
+    if values.get("status") != "processing":
+        _notify_task_waiters(task_id)
+
+
+def _notify_task_waiters(task_id: str) -> None:
+    with TASK_WAITERS_LOCK:
+        waiters = TASK_WAITERS.pop(task_id, [])
+    for loop, changed in waiters:
+        try:
+            loop.call_soon_threadsafe(changed.set)
+        except RuntimeError:
+            # The stream's event loop has already shut down.
+            pass
+
+
+def _load_task(task_id: str) -> Optional[dict[str, Any]]:
+    if TASK_REDIS is not None:
+        key = _task_key(task_id)
+        raw_task, body = TASK_REDIS.mget(key, f"{key}:body")
+        if raw_task is None:
+            return None
+        task = json.loads(raw_task)
+        if body is not None:
+            task["_body"] = body
+        return task
     with JOB_STORE_LOCK:
-        JOB_STORE[task_id] = {
-            **values,
-            "_updated_at": time.monotonic(),
-        }
+        task = JOB_STORE.get(task_id)
+        return dict(task) if task is not None else None
+
+
+async def _task_store_call(func: Any, *args: Any, **kwargs: Any) -> Any:
+    """Run a task-store call from a handler without blocking the event loop on Redis I/O."""
+    if TASK_REDIS is None:
+        return func(*args, **kwargs)
+    return await asyncio.to_thread(func, *args, **kwargs)
 
 
 def _public_task(task: dict[str, Any]) -> dict[str, Any]:
     return {key: value for key, value in task.items() if not key.startswith("_")}
 
 
-def _require_api_token(
+def _render_task_json(values: dict[str, Any], data_json: Optional[bytes] = None) -> bytes:
+    """Render a task response, splicing in the worker's job JSON without re-encoding it."""
+    public_json = json.dumps(_public_task(values)).encode()
+    if data_json is None:
+        return public_json
+    return public_json[:-1] + b', "data": ' + data_json + b"}"
+
+
+def _task_json(task: dict[str, Any]) -> bytes:
+    """Return the body rendered when the task was stored, so polling does no encoding."""
+    body = task.get("_body")
+    return body if body is not None else _render_task_json(task)
+
+
+async def _task_event_stream(task_id: str) -> AsyncIterator[bytes]:
+    """Yield keepalives until the task finishes, then its state as one SSE event."""
+    waiter = (asyncio.get_running_loop(), asyncio.Event())
+    with TASK_WAITERS_LOCK:
+        TASK_WAITERS.setdefault(task_id, []).append(waiter)
+    try:
+        while True:
+            # Re-reading after every keepalive also catches tasks finished by another
+            # API worker when the store is shared through Redis.
+            task = await _task_store_call(_load_task, task_id)
+            if task is None:
+                yield b'event: error\ndata: {"detail": "Task ID not found"}\n\n'
+                return
+            if task.get("status") != "processing":
+                yield b"data: " + _task_json(task) + b"\n\n"
+                return
+            try:
+                await asyncio.wait_for(waiter[1].wait(), timeout=TASK_EVENT_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+    finally:
+        with TASK_WAITERS_LOCK:
+            waiters = TASK_WAITERS.get(task_id)
+            if waiters and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del TASK_WAITERS[task_id]
+
+
+async def _require_api_token(
     x_jobspy_token: Optional[str] = Header(default=None),
 ) -> None:
     expected_token = os.getenv("JOBSPY_API_TOKEN", "").strip()
@@ -99,6 +239,17 @@ def _require_api_token(
         )
 
 
+def _request_fingerprint(request: "ScrapeRequest") -> str:
+    canonical = json.dumps(request.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def _forget_inflight_task(task_id: str) -> None:
+    with INFLIGHT_TASKS_LOCK:
+        for fingerprint in [key for key, value in INFLIGHT_TASKS.items() if value == task_id]:
+            del INFLIGHT_TASKS[fingerprint]
+
+
 def _acquire_scrape_slot() -> None:
     if not SCRAPE_SEMAPHORE.acquire(blocking=False):
         raise HTTPException(
@@ -154,10 +305,10 @@ class ScrapeRequest(ScraperInput):
     def parse_job_type(cls, value: Any) -> Any:
         if not isinstance(value, str):
             return value
-        for job_type in JobType:
-            if job_type.name.lower() == value.lower() or value.lower() in job_type.value:
-                return job_type
-        raise ValueError(f"Invalid job_type: {value}")
+        job_type = JOB_TYPE_LOOKUP.get(value.lower())
+        if job_type is None:
+            raise ValueError(f"Invalid job_type: {value}")
+        return job_type
 
     @field_validator("description_format", mode="before")
     @classmethod
@@ -199,8 +350,11 @@ def _run_scraper_worker(
         scraper_class = SCRAPER_MAPPING[site]
         scraper = scraper_class()
         results = scraper.scrape(request, **request.options)
-        jobs_data = [job.model_dump() for job in results.jobs]
-        result_queue.put({"status": "completed", "data": jobs_data})
+        # Serialize once here; the API process stores and returns this text as-is.
+        data_json = JOB_LIST_ADAPTER.dump_json(results.jobs)
+        result_queue.put(
+            {"status": "completed", "count": len(results.jobs), "data_json": data_json}
+        )
     except Exception as exc:
         logger.exception("Scrape worker failed for %s", site.value)
         result_queue.put({"status": "failed", "error": str(exc)})
@@ -274,14 +428,14 @@ def run_scraper_task(task_id: str, request: ScrapeRequest) -> None:
             _terminate_scraper_worker(process)
 
         if result.get("status") == "completed":
-            jobs_data = result.get("data") or []
+            count = int(result.get("count") or 0)
             _store_task(
                 task_id,
                 status="completed",
-                count=len(jobs_data),
-                data=jobs_data,
+                count=count,
+                data_json=result.get("data_json") or b"[]",
             )
-            logger.info("Task %s: completed with %s jobs", task_id, len(jobs_data))
+            logger.info("Task %s: completed with %s jobs", task_id, count)
             return
 
         error = str(result.get("error") or "scrape worker failed without an error message")
@@ -294,23 +448,37 @@ def run_scraper_task(task_id: str, request: ScrapeRequest) -> None:
         _terminate_scraper_worker(process)
         result_queue.close()
         result_queue.join_thread()
+        _forget_inflight_task(task_id)
         SCRAPE_SEMAPHORE.release()
 
 
 @app.post("/scrape", status_code=status.HTTP_202_ACCEPTED)
 async def submit_scrape_job(
     request: ScrapeRequest,
-    background_tasks: BackgroundTasks,
     _: None = Depends(_require_api_token),
 ) -> dict[str, str]:
     """Submit one bounded, allowlisted scraping task."""
     _cleanup_expired_tasks()
-    _acquire_scrape_slot()
-    task_id = str(uuid.uuid4())
-    _store_task(task_id, status="processing")
+    fingerprint = _request_fingerprint(request)
+    with INFLIGHT_TASKS_LOCK:
+        existing_task_id = INFLIGHT_TASKS.get(fingerprint)
+        if existing_task_id is None:
+            _acquire_scrape_slot()
+            task_id = str(uuid.uuid4())
+            INFLIGHT_TASKS[fingerprint] = task_id
+    if existing_task_id is not None:
+        # Identical requests share one scrape instead of hitting the site again.
+        return {
+            "task_id": existing_task_id,
+            "status": "processing",
+            "message": "Joined an identical job already in progress.",
+        }
+
     try:
-        background_tasks.add_task(run_scraper_task, task_id, request)
+        await _task_store_call(_store_task, task_id, status="processing")
+        SCRAPE_EXECUTOR.submit(run_scraper_task, task_id, request)
     except Exception:
+        _forget_inflight_task(task_id)
         SCRAPE_SEMAPHORE.release()
         raise
     return {
@@ -324,26 +492,40 @@ async def submit_scrape_job(
 async def check_job_status(
     task_id: str,
     _: None = Depends(_require_api_token),
-) -> dict[str, Any]:
+) -> Response:
     """Return a task state, including terminal failures as ordinary task data."""
     _cleanup_expired_tasks()
-    with JOB_STORE_LOCK:
-        job = JOB_STORE.get(task_id)
-        if job is not None:
-            job = dict(job)
+    job = await _task_store_call(_load_task, task_id)
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task ID not found")
-    return _public_task(job)
+    return Response(content=_task_json(job), media_type="application/json")
+
+
+@app.get("/events/{task_id}")
+async def stream_job_events(
+    task_id: str,
+    _: None = Depends(_require_api_token),
+) -> StreamingResponse:
+    """Push the task's terminal state as a server-sent event instead of status polling."""
+    _cleanup_expired_tasks()
+    if await _task_store_call(_load_task, task_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task ID not found")
+    return StreamingResponse(
+        _task_event_stream(task_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
 
 
 @app.get("/health")
-def health() -> dict[str, Any]:
+async def health() -> dict[str, Any]:
     """Unauthenticated container health endpoint."""
     _cleanup_expired_tasks()
     with JOB_STORE_LOCK:
         task_count = len(JOB_STORE)
     return {
         "status": "ok",
+        "task_store": "redis" if TASK_REDIS is not None else "memory",
         "jobs_in_memory": task_count,
         "allowed_sites": sorted(_allowed_sites()),
     }
@@ -121,7 +121,9 @@ def scrape_jobs(
         site_val, scraped_info = scrape_site(site)
         return site_val, scraped_info
 
-    with ThreadPoolExecutor() as executor:
+    # One thread per site: the default pool size scales with CPU count and would
+    # queue network-bound site scrapes behind each other on small hosts.
+    with ThreadPoolExecutor(max_workers=max(len(scraper_input.site_type), 1)) as executor:
         future_to_site = {
             executor.submit(worker, site): site for site in scraper_input.site_type
         }
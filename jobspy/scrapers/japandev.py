@@ -3,12 +3,17 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime
 from typing import List, Optional, Sequence
 from urllib.parse import urljoin
 import time
 
+import requests
+from bs4 import BeautifulSoup
 from playwright.sync_api import expect
 
 from jobspy.model import (
@@ -24,7 +29,9 @@ from jobspy.model import (
     CompensationInterval,
 )
 
+from jobspy.util import create_session, markdown_converter, plain_converter
 from jobspy.scrapers.utils import (
+    DEFAULT_USER_AGENT,
     managed_playwright_context,
     setup_page,
     parse_proxy_string,
@@ -71,6 +78,55 @@ logger = logging.getLogger(__name__)
 # scrape exactly at the configured request timeout.
 REQUEST_COMPLETION_BUFFER_SECONDS = 5
 
+# Detail pages are server-rendered, so they are fetched over plain HTTP in parallel
+# instead of navigating a browser page per job. Every request goes to the same host,
+# so the pool size is also the per-host concurrency cap; flooding it earns 429s.
+DETAIL_FETCH_WORKERS = 8
+# Attempts per page on 429/5xx and connection errors, with exponential backoff from the
+# base below. Retries live in _fetch_html rather than urllib3 so that neither the backoff
+# nor a server's Retry-After can outlast the scrape deadline and lose the partial results.
+DETAIL_FETCH_ATTEMPTS = 3
+DETAIL_RETRY_BACKOFF_SECONDS = 1
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Parsed detail pages are reused across scrapes in the same process; listings overlap
+# heavily from one run to the next, and postings rarely change within a day.
+DETAIL_CACHE_SIZE = 1024
+DETAIL_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+_SALARY_RE = re.compile(r"(\d+(?:\.\d+)?)")
+_SELECTED_CLASS_RE = re.compile(r".*\bselected\b.*")
+# Posted dates in the detail summary list, e.g. "January 8, 2026".
+_DATE_FMT = "%B %d, %Y"
+
+# Reads every listing card in one browser round trip instead of several locator
+# calls per card.
+_LISTING_CARDS_JS = """
+() => {
+    let cards = Array.from(document.querySelectorAll(".job-item"));
+    if (!cards.length) {
+        cards = Array.from(document.querySelectorAll(".top-jobs__job-item"));
+    }
+    return cards.map((card) => {
+        const titleEl = card.querySelector(".job-item__title") || card.querySelector("a.title.link");
+        const logoEl = card.querySelector("img.company-logo__inner");
+        return {
+            title: titleEl ? titleEl.innerText.trim() : null,
+            href: titleEl ? titleEl.getAttribute("href") : null,
+            company: logoEl ? logoEl.getAttribute("alt") : null,
+        };
+    });
+}
+"""
+
+
+@dataclass(frozen=True)
+class _JobSeed:
+    """Listing-card data collected in the browser before the detail pages are fetched."""
+    title: str
+    job_url: str
+    company_name: str | None
+
 
 @dataclass(frozen=True)
 class _RawFilter:
@@ -82,9 +138,57 @@ class _RawFilter:
     key: str
     token: str
 
+    @property
+    def full_id(self) -> str:
+        return f"{self.key}-{self.token}"
+
     @property
     def selector(self) -> str:
-        return f"[id='{self.key}-{self.token}']"
+        return f"[id='{self.full_id}']"
+
+
+class _DetailCache:
+    """Thread-safe LRU of parsed detail fields keyed by job URL and description format."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str]) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, detail = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return detail
+
+    def put(self, key: tuple[str, str], detail: dict) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), detail)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_DETAIL_CACHE = _DetailCache(DETAIL_CACHE_SIZE, DETAIL_CACHE_TTL_SECONDS)
+
+
+def _retry_after_seconds(response) -> Optional[float]:
+    """Seconds from a numeric Retry-After header; None when absent or an HTTP date."""
+    try:
+        return max(0.0, float(response.headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
 
 
 class JapanDev(Scraper):
@@ -104,7 +208,7 @@ class JapanDev(Scraper):
 
         # Examples seen on JapanDev detail pages:
         # "10M 14M yr", "8.5M 12M", etc.
-        matches = re.findall(r"(\d+(?:\.\d+)?)", salary_text.replace(",", ""))
+        matches = _SALARY_RE.findall(salary_text.replace(",", ""))
         if len(matches) < 1:
             return None
 
@@ -120,66 +224,60 @@ class JapanDev(Scraper):
         except Exception:
             return None
 
-    def _extract_detail_fields(self, detail_page, scraper_input: ScraperInput) -> dict:
+    def _extract_detail_fields(self, html: str, scraper_input: ScraperInput) -> dict:
+        soup = BeautifulSoup(html, "html.parser")
+
+        def text_of(selector: str) -> str | None:
+            el = soup.select_one(selector)
+            return el.get_text(" ", strip=True) if el else None
+
         # Title
-        title = None
-        title_el = detail_page.locator("h1.job-detail__job-name").first
-        if title_el.count() > 0:
-            title = title_el.inner_text().strip()
+        title = text_of("h1.job-detail__job-name")
 
         # Company
-        company_name = None
-        company_el = detail_page.locator("a.job-logo__company-name").first
-        if company_el.count() > 0:
-            company_name = company_el.inner_text().strip()
+        company_name = text_of("a.job-logo__company-name")
 
         # Location
-        location_text = None
-        loc_el = detail_page.locator("div.job-logo__location").first
-        if loc_el.count() > 0:
-            location_text = loc_el.inner_text().strip()
-        else:
-            summary_first = detail_page.locator("ul.job-detail__summary-list li span").first
-            if summary_first.count() > 0:
-                location_text = summary_first.inner_text().strip()
+        summary_spans = soup.select("ul.job-detail__summary-list li span")
+        location_text = text_of("div.job-logo__location")
+        if location_text is None and summary_spans:
+            location_text = summary_spans[0].get_text(" ", strip=True)
 
         # Date posted
         posted = None
-        summary_spans = detail_page.locator("ul.job-detail__summary-list li span").all()
         if summary_spans:
-            maybe_date = summary_spans[-1].inner_text().strip()
+            maybe_date = summary_spans[-1].get_text(" ", strip=True)
             try:
-                posted = datetime.strptime(maybe_date, "%B %d, %Y").date()
+                posted = datetime.strptime(maybe_date, _DATE_FMT).date()
             except Exception:
                 posted = None
 
         # Salary tag (yen icon)
-        salary_text = None
-        salary_tag = detail_page.locator(
-            "div.job-detail-tag-list__basic-tag:has(img[alt='yen-icon'])"
-        ).first
-        if salary_tag.count() > 0:
-            salary_desc = salary_tag.locator("div.job-detail-tag-list__tag-desc").first
-            if salary_desc.count() > 0:
-                salary_text = salary_desc.inner_text().strip()
+        salary_text = text_of(
+            "div.job-detail-tag-list__basic-tag:has(img[alt='yen-icon']) "
+            "div.job-detail-tag-list__tag-desc"
+        )
 
         # Apply link
         job_url_direct = None
-        apply_el = detail_page.locator("a:has-text('APPLY NOW')").first
-        if apply_el.count() > 0:
-            job_url_direct = apply_el.get_attribute("href")
+        for anchor in soup.find_all("a"):
+            if "apply now" in anchor.get_text(" ", strip=True).lower():
+                job_url_direct = anchor.get("href")
+                break
 
         # Description
         description = None
-        body_el = detail_page.locator("div.job-detail-main-content div.body").first
-        if body_el.count() == 0:
-            body_el = detail_page.locator("div.job-detail-main-content").first
-
-        if body_el.count() > 0:
-            if scraper_input.description_format == DescriptionFormat.HTML:
-                description = body_el.inner_html()
-            else:
-                description = body_el.inner_text()
+        body_el = soup.select_one("div.job-detail-main-content div.body")
+        if body_el is None:
+            body_el = soup.select_one("div.job-detail-main-content")
+
+        if body_el is not None:
+            description = body_el.decode_contents()
+            # Same converters as the other scrapers, so inline tags keep sentences intact.
+            if scraper_input.description_format == DescriptionFormat.MARKDOWN:
+                description = markdown_converter(description)
+            elif scraper_input.description_format == DescriptionFormat.PLAIN:
+                description = plain_converter(description)
 
         return {
             "title": title,
@@ -194,8 +292,7 @@ class JapanDev(Scraper):
     def _click_filter(self, page, option: FilterEnum | _RawFilter) -> None:
         """Ensure filter is selected (toggle ON if currently OFF)."""
         full_id = option.full_id
-        loc = page.locator(f"[id='{full_id}']")
-        selected_re = re.compile(r".*\bselected\b.*")
+        loc = page.locator(option.selector)
         
         # Check current state reliably
         try:
@@ -220,7 +317,7 @@ class JapanDev(Scraper):
                 loc.click(force=(attempt > 0), no_wait_after=True, timeout=2000)
                 
                 # Verify it's now selected
-                expect(loc).to_have_class(selected_re, timeout=2000)
+                expect(loc).to_have_class(_SELECTED_CLASS_RE, timeout=2000)
                 logger.debug(f"Successfully selected filter {full_id}")
                 return
                 
@@ -329,24 +426,181 @@ class JapanDev(Scraper):
         )
         return time.monotonic() + timeout_seconds - completion_buffer
 
-    def scrape(
+    def _collect_job_seeds(self, page) -> list[_JobSeed]:
+        """Read title, URL, and company from the listing cards in listing order."""
+        try:
+            cards = page.evaluate(_LISTING_CARDS_JS)
+        except Exception as e:
+            logger.warning(f"Error reading JapanDev job cards: {e}")
+            return []
+
+        seeds: dict[str, _JobSeed] = {}
+        for card in cards:
+            if not card.get("title") or not card.get("href"):
+                continue
+
+            job_url = urljoin(self.base_url, card["href"])
+            # Company name fallback (detail page overrides)
+            seeds.setdefault(job_url, _JobSeed(card["title"], job_url, card.get("company")))
+        return list(seeds.values())
+
+    def _parse_listing_html(self, html: str) -> list[_JobSeed]:
+        """
+        Read the same listing-card fields as _collect_job_seeds from server-rendered HTML.
+
+        Only the main .job-item list counts. A page carrying just the featured top-jobs block
+        has its real list rendered client-side, so it yields nothing and the browser is used.
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        job_cards = soup.select(".job-item")
+
+        seeds: dict[str, _JobSeed] = {}
+        for card in job_cards:
+            title_el = card.select_one(".job-item__title") or card.select_one("a.title.link")
+            if title_el is None or not title_el.get("href"):
+                continue
+
+            job_url = urljoin(self.base_url, title_el["href"])
+            img_el = card.select_one("img.company-logo__inner")
+            company_name = img_el.get("alt") if img_el else None
+            seeds.setdefault(
+                job_url,
+                _JobSeed(title_el.get_text(" ", strip=True), job_url, company_name),
+            )
+        return list(seeds.values())
+
+    @staticmethod
+    def _fetch_html(session, url: str, deadline: float) -> str:
+        """GET url, retrying 429/5xx and connection errors only while the deadline allows."""
+        for attempt in range(DETAIL_FETCH_ATTEMPTS):
+            timeout_seconds = remaining_timeout_ms(deadline) / 1000
+            if timeout_seconds <= 0:
+                raise TimeoutError(f"request timeout reached before {url} was fetched")
+            last_attempt = attempt == DETAIL_FETCH_ATTEMPTS - 1
+            try:
+                response = session.get(url, timeout=timeout_seconds)
+            except requests.ConnectionError:
+                if last_attempt:
+                    raise
+                wait_seconds = None
+            else:
+                if last_attempt or response.status_code not in _RETRY_STATUSES:
+                    response.raise_for_status()
+                    return response.text
+                wait_seconds = _retry_after_seconds(response)
+
+            if wait_seconds is None:
+                wait_seconds = DETAIL_RETRY_BACKOFF_SECONDS * 2 ** attempt
+            if wait_seconds >= remaining_timeout_ms(deadline) / 1000:
+                raise TimeoutError(f"request timeout would pass while waiting to retry {url}")
+            time.sleep(wait_seconds)
+
+    def _build_job_post(self, seed: _JobSeed, detail: dict) -> JobPost:
+        final_title = detail["title"] or seed.title
+        final_company = detail["company_name"] or seed.company_name
+        final_location_text = detail["location_text"] or "Japan"
+        comp = self._parse_salary_to_comp(detail["salary_text"])
+
+        loc = Location(
+            country=Country.JAPAN,
+            city=final_location_text,
+        )
+
+        # Extract job ID from URL for uniqueness
+        job_id = seed.job_url.rstrip("/").rsplit("/", 1)[-1] if seed.job_url else "unknown"
+
+        return JobPost(
+            id=f"jd-{job_id}",
+            title=final_title,
+            company_name=final_company,
+            job_url=seed.job_url,
+            job_url_direct=detail["job_url_direct"],
+            location=loc,
+            description=detail["description"],
+            compensation=comp,
+            date_posted=detail["date_posted"] or date.today(),
+        )
+
+    def _create_http_session(self):
+        session = create_session(
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            is_tls=False,
+        )
+        session.headers.update(
+            {
+                "User-Agent": self.user_agent or DEFAULT_USER_AGENT,
+                "Accept-Language": "en-US,en;q=0.9",
+            }
+        )
+        return session
+
+    def _scrape_details(
         self,
+        session,
+        seeds: list[_JobSeed],
         scraper_input: ScraperInput,
-        *,
-        applicant_locations: Optional[Sequence[JdApplicantLocation | str]] = None,
-        japanese_levels: Optional[Sequence[JdJapaneseLevel | str]] = None,
-        english_levels: Optional[Sequence[JdEnglishLevel | str]] = None,
-        remote_work: Optional[Sequence[JdRemoteWork | str]] = None,
-        seniorities: Optional[Sequence[JdSeniority | str]] = None,
-        salary_filters: Optional[Sequence[JdSalary | str]] = None,
-        job_types: Optional[Sequence[JdJobType | str]] = None,
-        office_locations: Optional[Sequence[JdOfficeLocation | str]] = None,
-        company_types: Optional[Sequence[JdCompanyType | str]] = None,
-        skills: Optional[Sequence[JdSkill | str]] = None,
-        raw_filters: Optional[Sequence[_RawFilter]] = None,
-    ) -> JobResponse:
+        deadline: float,
+    ) -> list[JobPost]:
+        """Fetch detail pages concurrently, topping up batches until enough jobs parse."""
         job_list: List[JobPost] = []
+        pending = list(seeds)
+        description_format = str(scraper_input.description_format)
+
+        with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as executor:
+            while pending and len(job_list) < scraper_input.results_wanted:
+                if remaining_timeout_ms(deadline) <= 0:
+                    logger.info("JapanDev scrape reached its request timeout with %s jobs", len(job_list))
+                    break
 
+                needed = scraper_input.results_wanted - len(job_list)
+                batch, pending = pending[:needed], pending[needed:]
+                cached = [_DETAIL_CACHE.get((seed.job_url, description_format)) for seed in batch]
+                futures = [
+                    None
+                    if detail is not None
+                    else executor.submit(self._fetch_html, session, seed.job_url, deadline)
+                    for seed, detail in zip(batch, cached)
+                ]
+
+                for seed, detail, future in zip(batch, cached, futures):
+                    try:
+                        if future is not None:
+                            detail = self._extract_detail_fields(future.result(), scraper_input)
+                    except Exception as e:
+                        logger.warning(f"Failed to extract details for {seed.job_url}: {e}")
+                        continue
+
+                    if not str(detail.get("description") or "").strip():
+                        logger.warning("Skipping JapanDev job without a description: %s", seed.job_url)
+                        continue
+                    if future is not None:
+                        _DETAIL_CACHE.put((seed.job_url, description_format), detail)
+
+                    try:
+                        job_list.append(self._build_job_post(seed, detail))
+                    except Exception as e:
+                        logger.warning(f"Error parsing job card: {e}")
+                        continue
+
+        return job_list
+
+    def _collect_static_job_seeds(self, session, deadline: float) -> list[_JobSeed]:
+        """Read the unfiltered listing over HTTP; empty when the cards are not server-rendered."""
+        try:
+            html = self._fetch_html(session, self.base_url, deadline)
+        except Exception as e:
+            logger.info(f"JapanDev listing is not reachable over HTTP, using the browser: {e}")
+            return []
+        return self._parse_listing_html(html)
+
+    def _collect_browser_job_seeds(
+        self,
+        scraper_input: ScraperInput,
+        deadline: float,
+        filters: dict,
+    ) -> list[_JobSeed]:
+        """Load the listing in Playwright, apply the UI filters, and read the job cards."""
         proxy_str = None
         if self.proxies:
             if isinstance(self.proxies, list) and len(self.proxies) > 0:
@@ -355,7 +609,6 @@ class JapanDev(Scraper):
                 proxy_str = self.proxies
 
         proxy = parse_proxy_string(proxy_str) if proxy_str else None
-        deadline = self._request_deadline(scraper_input.request_timeout)
 
         with managed_playwright_context(
                 proxy=proxy,
@@ -366,7 +619,7 @@ class JapanDev(Scraper):
             page = setup_page(context, block_resources=True)
             page_timeout_ms = remaining_timeout_ms(deadline)
             if page_timeout_ms <= 0:
-                return JobResponse(jobs=[])
+                return []
             page.set_default_timeout(page_timeout_ms)
             page.set_default_navigation_timeout(page_timeout_ms)
 
@@ -379,129 +632,74 @@ class JapanDev(Scraper):
                 )
                 page_timeout_ms = remaining_timeout_ms(deadline)
                 if page_timeout_ms <= 0:
-                    return JobResponse(jobs=[])
+                    return []
                 page.wait_for_selector(".filters", timeout=page_timeout_ms)
             except Exception as e:
                 logger.error(f"Failed to load JapanDev listing page: {e}")
-                return JobResponse(jobs=[])
+                return []
 
             # Apply UI filters
-            self._apply_filters(
-                page,
-                scraper_input,
-                deadline=deadline,
-                applicant_locations=applicant_locations,
-                japanese_levels=japanese_levels,
-                english_levels=english_levels,
-                remote_work=remote_work,
-                seniorities=seniorities,
-                salary_filters=salary_filters,
-                job_types=job_types,
-                office_locations=office_locations,
-                company_types=company_types,
-                skills=skills,
-                raw_filters=raw_filters,
-            )
+            self._apply_filters(page, scraper_input, deadline=deadline, **filters)
 
             # Let the job-card selector below confirm the filtered results. Some pages keep
             # analytics connections open indefinitely, so network-idle is not a hard gate.
             page_timeout_ms = remaining_timeout_ms(deadline)
             if page_timeout_ms <= 0:
-                return JobResponse(jobs=[])
+                return []
 
             # Get listing cards
-            job_cards = []
             try:
                 page.wait_for_selector(".job-item, .top-jobs__job-item, .no-results", timeout=5000)
             except Exception:
                 pass
 
-            job_cards = page.locator(".job-item").all()
-            if not job_cards:
-                job_cards = page.locator(".top-jobs__job-item").all()
-
-            for card in job_cards:
-                if len(job_list) >= scraper_input.results_wanted:
-                    break
-
-                detail_timeout_ms = remaining_timeout_ms(deadline)
-                if detail_timeout_ms <= 0:
-                    logger.info("JapanDev scrape reached its request timeout with %s jobs", len(job_list))
-                    break
-
-                try:
-                    title_el = card.locator(".job-item__title").first
-                    if title_el.count() == 0:
-                        title_el = card.locator("a.title.link").first
-                    if title_el.count() == 0:
-                        continue
-
-                    title = title_el.inner_text().strip()
-                    job_url_relative = title_el.get_attribute("href")
-                    if not job_url_relative:
-                        continue
-
-                    job_url = urljoin(self.base_url, job_url_relative)
+            return self._collect_job_seeds(page)
 
-                    # Company name fallback (detail page overrides)
-                    company_name = None
-                    img_el = card.locator("img.company-logo__inner").first
-                    if img_el.count() > 0:
-                        company_name = img_el.get_attribute("alt")
-
-                    detail_page = setup_page(context, block_resources=True)
-                    try:
-                        detail_page.set_default_timeout(detail_timeout_ms)
-                        detail_page.set_default_navigation_timeout(detail_timeout_ms)
-                        detail_page.goto(
-                            job_url,
-                            timeout=detail_timeout_ms,
-                            wait_until="domcontentloaded",
-                        )
-                        detail_timeout_ms = remaining_timeout_ms(deadline)
-                        if detail_timeout_ms <= 0:
-                            break
-                        detail_page.set_default_timeout(detail_timeout_ms)
-                        detail = self._extract_detail_fields(detail_page, scraper_input)
-                    except Exception as e:
-                        logger.warning(f"Failed to extract details for {job_url}: {e}")
-                        continue
-                    finally:
-                        detail_page.close()
-
-                    if not str(detail.get("description") or "").strip():
-                        logger.warning("Skipping JapanDev job without a description: %s", job_url)
-                        continue
-
-                    final_title = detail["title"] or title
-                    final_company = detail["company_name"] or company_name
-                    final_location_text = detail["location_text"] or "Japan"
-                    comp = self._parse_salary_to_comp(detail["salary_text"])
-
-                    loc = Location(
-                        country=Country.JAPAN,
-                        city=final_location_text,
-                    )
-
-                    # Extract job ID from URL for uniqueness
-                    job_id = job_url.rstrip("/").rsplit("/", 1)[-1] if job_url else "unknown"
-
-                    job_list.append(
-                        JobPost(
-                            id=f"jd-{job_id}",
-                            title=final_title,
-                            company_name=final_company,
-                            job_url=job_url,
-                            job_url_direct=detail["job_url_direct"],
-                            location=loc,
-                            description=detail["description"],
-                            compensation=comp,
-                            date_posted=detail["date_posted"] or date.today(),
-                        )
-                    )
-
-                except Exception as e:
-                    logger.warning(f"Error parsing job card: {e}")
-                    continue
-
-            return JobResponse(jobs=job_list)
+    def scrape(
+        self,
+        scraper_input: ScraperInput,
+        *,
+        applicant_locations: Optional[Sequence[JdApplicantLocation | str]] = None,
+        japanese_levels: Optional[Sequence[JdJapaneseLevel | str]] = None,
+        english_levels: Optional[Sequence[JdEnglishLevel | str]] = None,
+        remote_work: Optional[Sequence[JdRemoteWork | str]] = None,
+        seniorities: Optional[Sequence[JdSeniority | str]] = None,
+        salary_filters: Optional[Sequence[JdSalary | str]] = None,
+        job_types: Optional[Sequence[JdJobType | str]] = None,
+        office_locations: Optional[Sequence[JdOfficeLocation | str]] = None,
+        company_types: Optional[Sequence[JdCompanyType | str]] = None,
+        skills: Optional[Sequence[JdSkill | str]] = None,
+        raw_filters: Optional[Sequence[_RawFilter]] = None,
+    ) -> JobResponse:
+        filters = {
+            "applicant_locations": applicant_locations,
+            "japanese_levels": japanese_levels,
+            "english_levels": english_levels,
+            "remote_work": remote_work,
+            "seniorities": seniorities,
+            "salary_filters": salary_filters,
+            "job_types": job_types,
+            "office_locations": office_locations,
+            "company_types": company_types,
+            "skills": skills,
+            "raw_filters": raw_filters,
+        }
+        deadline = self._request_deadline(scraper_input.request_timeout)
+        session = self._create_http_session()
+        try:
+            # Search and filters are applied through the Algolia UI, so only the unfiltered
+            # listing can be read from the server-rendered HTML without launching a browser.
+            seeds: list[_JobSeed] = []
+            needs_browser = bool(
+                scraper_input.search_term
+                or scraper_input.is_remote
+                or any(filters.values())
+            )
+            if not needs_browser:
+                seeds = self._collect_static_job_seeds(session, deadline)
+            if not seeds:
+                seeds = self._collect_browser_job_seeds(scraper_input, deadline, filters)
+
+            return JobResponse(jobs=self._scrape_details(session, seeds, scraper_input, deadline))
+        finally:
+            session.close()
@@ -15,21 +15,19 @@ class FilterEnum(str, Enum):
     """
     _key: str  # subclasses override
 
-    @property
-    def pair(self) -> tuple[str, str]:
-        # correctly reads the class-level _key attribute
-        return (type(self)._key, self.value)
-
-    @property
-    def full_id(self) -> str:
-        k, v = self.pair
-        return f"{k}-{v}"
-
-    @property
-    def selector(self) -> str:
+    pair: tuple[str, str]
+    full_id: str
+    selector: str
+
+    def __init__(self, token: str) -> None:
+        # Members are immutable, so the DOM id and selector are built once when the
+        # subclass is created instead of on every access. _key is already a class
+        # attribute here because nonmember() values are set before members are built.
+        key = type(self)._key
+        self.pair = (key, token)
+        self.full_id = f"{key}-{token}"
         # Attribute selector avoids CSS escaping issues for spaces, '/', '+', etc.
-        return f"[id='{self.full_id}']"
-
+        self.selector = f"[id='{self.full_id}']"
 
 
 class JdApplicantLocation(FilterEnum):
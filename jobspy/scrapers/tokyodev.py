@@ -376,6 +376,10 @@ class TokyoDev(Scraper):
 
             seeds = self._extract_seeds_from_list_page(list_page, scraper_input.results_wanted)
 
+            # One detail tab is navigated from job to job; it is closed with the context, and
+            # replaced after a failure so a dead or stuck page cannot poison the next seeds.
+            detail_page = setup_page(context, block_resources=False)
+
             for seed in seeds:
                 if len(job_list) >= scraper_input.results_wanted:
                     break
@@ -385,7 +389,6 @@ class TokyoDev(Scraper):
                     logger.info("TokyoDev scrape reached its request timeout with %s jobs", len(job_list))
                     break
 
-                detail_page = setup_page(context, block_resources=False)
                 try:
                     detail_page.set_default_timeout(detail_timeout_ms)
                     detail_page.set_default_navigation_timeout(detail_timeout_ms)
@@ -474,8 +477,12 @@ class TokyoDev(Scraper):
 
                 except Exception as e:
                     logger.error(f"Failed to process job {seed.job_url}: {e}")
+                    try:
+                        detail_page.close()
+                    except Exception:
+                        logger.debug("Failed to close TokyoDev detail page", exc_info=True)
+                    detail_page = setup_page(context, block_resources=False)
                 finally:
-                    detail_page.close()
                     time.sleep(0.3)
 
             return JobResponse(jobs=job_list)
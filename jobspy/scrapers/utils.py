@@ -1,15 +1,29 @@
+import functools
+import json
 import logging
 import os
+import re
 from contextlib import contextmanager
 from typing import Iterator, Optional
 from urllib.parse import urlparse
 import random
 import time
+import weakref
 
 from playwright.sync_api import Browser, BrowserContext, Page, sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 logger = logging.getLogger(__name__)
 
+# Contexts that already abort heavy media through a context route.
+_RESOURCE_BLOCKING_CONTEXTS: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+# Whether each page's latest main-frame navigation response looked like a Cloudflare challenge.
+_PAGE_CF_CHALLENGED: "weakref.WeakKeyDictionary[Page, bool]" = weakref.WeakKeyDictionary()
+# Cloudflare serves its interstitials with these statuses and a "cloudflare" Server header.
+_CLOUDFLARE_CHALLENGE_STATUSES = frozenset({403, 503})
+
+# GPU stays on via SwiftShader rather than --disable-gpu: a browser without WebGL is an
+# easy bot fingerprint. The remaining flags trim services a headless scraper never uses.
 _CONSTRAINED_RUNTIME_BROWSER_ARGS = (
     "--use-gl=angle",
     "--use-angle=swiftshader",
@@ -17,16 +31,96 @@ _CONSTRAINED_RUNTIME_BROWSER_ARGS = (
     "--disable-background-networking",
     "--no-first-run",
     "--no-default-browser-check",
+    "--disable-dev-shm-usage",  # Docker's 64MB /dev/shm crashes renderers; use /tmp
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--mute-audio",
 )
 
+# Every browser identity signal (User-Agent, sec-ch-ua, navigator.userAgentData) is built
+# from one Chrome major version so they can never disagree with each other.
+DEFAULT_CHROME_MAJOR_VERSION = "130"
+_USER_AGENT_TEMPLATE = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{major}.0.0.0 Safari/537.36"
+# Shared by the Playwright contexts and the plain HTTP sessions used for detail pages.
+DEFAULT_USER_AGENT = _USER_AGENT_TEMPLATE.format(major=DEFAULT_CHROME_MAJOR_VERSION)
+
+# Context-level settings shared by every context; Playwright only reads them.
+# These are safe to send with every request via set_extra_http_headers.
+_EXTRA_HEADERS = {
+    "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+    "accept-language": "en-US,en;q=0.9",
+    "priority": "u=0, i",
+    "upgrade-insecure-requests": "1",
+}
+_VIEWPORT = {"width": 1920, "height": 1080}
+_WEBDRIVER_PATCH = "Object.defineProperty(navigator, 'webdriver', { get: () => undefined });"
+_USER_AGENT_DATA_PATCH = """
+(() => {
+    const data = {
+        brands: %(brands)s,
+        mobile: false,
+        platform: 'macOS',
+    };
+    const highEntropy = Object.assign({}, data, {
+        fullVersionList: data.brands,
+        platformVersion: '10.15.7',
+        uaFullVersion: '%(major)s.0.0.0',
+    });
+    Object.defineProperty(navigator, 'userAgentData', { get: () => Object.assign({}, data, {
+        getHighEntropyValues: () => Promise.resolve(highEntropy),
+        toJSON: () => data,
+    }) });
+})();
+"""
+
+
+def _browser_chrome_major(browser: Browser) -> str:
+    """Major version of the running engine, so headers match what the browser really is."""
+    version = getattr(browser, "version", "")
+    major = version.split(".", 1)[0] if isinstance(version, str) else ""
+    return major if major.isdigit() else DEFAULT_CHROME_MAJOR_VERSION
+
+
+@functools.lru_cache(maxsize=8)
+def _browser_identity(major: str) -> tuple:
+    """User-Agent, extra headers and init script that all claim to be Chrome `major` on macOS."""
+    brands = [("Chromium", major), ("Google Chrome", major), ("Not?A_Brand", "99")]
+    headers = {
+        **_EXTRA_HEADERS,
+        "sec-ch-ua": ", ".join(f'"{brand}";v="{version}"' for brand, version in brands),
+        "sec-ch-ua-mobile": "?0",
+        "sec-ch-ua-platform": '"macOS"',
+    }
+    brands_js = json.dumps([{"brand": brand, "version": version} for brand, version in brands])
+    init_script = _WEBDRIVER_PATCH + _USER_AGENT_DATA_PATCH % {"brands": brands_js, "major": major}
+    return _USER_AGENT_TEMPLATE.format(major=major), headers, init_script
+
 
 def remaining_timeout_ms(deadline: float) -> int:
     """Return the remaining request budget in milliseconds without going negative."""
     return max(0, int((deadline - time.monotonic()) * 1000))
 
 
+def connect_shared_browser(playwright, cdp_endpoint: str) -> Browser:
+    """
+    Attach to an already running Chromium over CDP so several workers share one browser.
+
+    Start it with e.g. `chromium --remote-debugging-port=9222 --user-data-dir=/tmp/cdp`.
+    The caller owns the Playwright driver and stops it as usual. Closing the returned
+    Browser only disconnects; the shared process keeps running.
+    """
+    return playwright.chromium.connect_over_cdp(cdp_endpoint)
+
+
 def launch_playwright_browser(playwright) -> Browser:
-    """Launch the configured browser with stable flags for QEMU/Docker runtimes."""
+    """
+    Launch the configured browser with stable flags for QEMU/Docker runtimes.
+
+    When JOBSPY_PLAYWRIGHT_CDP_ENDPOINT is set, connect to that shared browser instead.
+    """
+    cdp_endpoint = os.getenv("JOBSPY_PLAYWRIGHT_CDP_ENDPOINT", "").strip()
+    if cdp_endpoint:
+        return connect_shared_browser(playwright, cdp_endpoint)
     channel = os.getenv("JOBSPY_PLAYWRIGHT_CHANNEL", "chrome").strip().lower()
     launch_options = {
         "headless": True,
@@ -69,17 +163,22 @@ def managed_playwright_context(
                 except Exception:
                     logger.warning("Failed to close Playwright browser", exc_info=True)
 
+@functools.lru_cache(maxsize=256)
+def _parse_proxy_cached(proxy_str: str) -> tuple:
+    """Parse a proxy URL once; scrapers rotate through a small, repeating proxy list."""
+    parsed = urlparse(proxy_str)
+    return (f"{parsed.scheme}://{parsed.hostname}:{parsed.port}", parsed.username, parsed.password)
+
 def parse_proxy_string(proxy_str: str) -> dict:
     if not proxy_str:
         return None
-    parsed = urlparse(proxy_str)
-    proxy_dict = {
-        "server": f"{parsed.scheme}://{parsed.hostname}:{parsed.port}"
-    }
-    if parsed.username:
-        proxy_dict["username"] = parsed.username
-    if parsed.password:
-        proxy_dict["password"] = parsed.password
+    server, username, password = _parse_proxy_cached(proxy_str)
+    # A fresh dict per call, so callers can never mutate the cached entry.
+    proxy_dict = {"server": server}
+    if username:
+        proxy_dict["username"] = username
+    if password:
+        proxy_dict["password"] = password
     return proxy_dict
 
 def create_playwright_context(
@@ -88,37 +187,26 @@ def create_playwright_context(
     user_agent: Optional[str] = None, # Make sure this matches your headers!
     request_timeout: int = 30,
 ) -> BrowserContext:
-    
+    """
+    Create an isolated context on browser. The browser may be launched locally or attached
+    via connect_shared_browser, in which case many worker processes share one Chromium.
+    """
     # 1. Separate "Context-Level" headers from "Request-Level" headers
     # These headers MUST match the browser engine you are using (e.g. Chrome 130)
     # If your Playwright installs Chromium 131, but you send headers for 130, you will get flagged.
-    
-    # Define the User-Agent strictly
-    final_ua = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36"
-
-    # 2. Define Extra Headers (Standard Headers)
-    # These are safe to send with every request via set_extra_http_headers
-    extra_headers = {
-        "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-        "accept-language": "en-US,en;q=0.9",
-        "priority": "u=0, i",
-        "upgrade-insecure-requests": "1",
-    }
+    # So the UA, sec-ch-ua headers and navigator.userAgentData all follow the engine's version.
+    final_ua, extra_headers, init_script = _browser_identity(_browser_chrome_major(browser))
 
-    # 3. Configure Context Arguments
+    # 2. Configure Context Arguments
     context_args = {
         "user_agent": final_ua,
-        "viewport": {"width": 1920, "height": 1080},
+        "viewport": _VIEWPORT,
         "locale": "en-US",
         "timezone_id": "America/New_York",
         "color_scheme": "light", # Matches sec-ch-prefers-color-scheme
         
-        # EXPERIMENTAL: Try to set client hints via permissions/args if possible, 
-        # but Playwright doesn't have a direct "sec_ch_ua" arg in new_context.
-        # We handle this by injecting them or relying on the browser to generate them 
-        # based on the User-Agent. 
-        # WARNING: Manually forcing Sec-CH-UA headers in extra_headers can sometimes 
-        # cause "Invalid Header" errors if the browser tries to send them too.
+        # Playwright doesn't have a direct "sec_ch_ua" arg in new_context, so the
+        # client hints are sent via extra headers built from the same version as the UA.
     }
 
     if proxy:
@@ -126,59 +214,121 @@ def create_playwright_context(
 
     context = browser.new_context(**context_args)
     
-    # 4. Apply the safe extra headers
+    # 3. Apply the safe extra headers
     context.set_extra_http_headers(extra_headers)
 
-    # 5. Apply the navigator.webdriver patch
-    context.add_init_script("""
-        Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-    """)
+    # 4. Apply the navigator.webdriver and navigator.userAgentData patches
+    context.add_init_script(init_script)
 
     context.set_default_timeout(request_timeout * 1000)
     context.set_default_navigation_timeout(request_timeout * 1000)
     
     return context
 
+# Image and media URLs dropped by Chromium's own network stack. Fonts and stylesheets stay
+# allowed: blocking them trips Cloudflare.
+_BLOCKED_MEDIA_EXTENSIONS = (
+    "png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico",
+    "mp4", "webm", "mp3", "m4a", "ogg",
+)
+_BLOCKED_URL_PATTERNS = [
+    pattern
+    for ext in _BLOCKED_MEDIA_EXTENSIONS
+    for pattern in (f"*.{ext}", f"*.{ext}?*")
+]
+# The same filter for the route fallback; Playwright matches it before calling into Python.
+_BLOCKED_URL_RE = re.compile(
+    r"\.(?:" + "|".join(_BLOCKED_MEDIA_EXTENSIONS) + r")(?:\?|$)", re.I
+)
+
+def block_heavy_resources(context: BrowserContext, page: Page) -> None:
+    """
+    Block heavy media for the page inside the browser via CDP Network.setBlockedURLs.
+
+    Unlike a route handler, requests never wait on a Python callback. Network.enable does
+    make Chromium emit one-way Network.* events for every request on this session, which
+    Playwright still forwards to Python and decodes. Browsers without CDP fall back to a
+    context route that only sees URLs matching _BLOCKED_URL_RE.
+    """
+    try:
+        cdp = context.new_cdp_session(page)
+        cdp.send("Network.enable")
+        cdp.send("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+        return
+    except Exception:
+        logger.debug("CDP URL blocking unavailable; falling back to route", exc_info=True)
+    if context in _RESOURCE_BLOCKING_CONTEXTS:
+        return
+    context.route(_BLOCKED_URL_RE, _abort_route)
+    _RESOURCE_BLOCKING_CONTEXTS.add(context)
+
+def _abort_route(route) -> None:
+    route.abort()
+
 def setup_page(context: BrowserContext, block_resources: bool = False) -> Page:
     """
     Creates a new page.
     IMPORTANT: block_resources defaults to False. Blocking fonts/images triggers Cloudflare detection.
     """
     page = context.new_page()
-    
+    track_cloudflare_mitigation(page)
+
     # Only block heavy media if absolutely necessary, but NEVER block fonts/css for Cloudflare
     if block_resources:
-        page.route("**/*", route_intercept)
-        
+        block_heavy_resources(context, page)
+
     return page
 
-def route_intercept(route):
-    """
-    Modified to be safer. Only block media/images if you must.
-    NEVER block 'font' or 'stylesheet' when fighting Cloudflare.
-    """
-    request = route.request
-    resource_type = request.resource_type
-    
-    # Block only heavy media, allow fonts/css/scripts
-    if resource_type in ["media", "image"]: 
-        route.abort()
-    else:
-        route.continue_()
+def is_cloudflare_challenge_response(response) -> bool:
+    """Classify a response from its status and headers alone, without reading the body."""
+    headers = response.headers
+    if headers.get("cf-mitigated") == "challenge":
+        return True
+    return (
+        response.status in _CLOUDFLARE_CHALLENGE_STATUSES
+        and headers.get("server", "").lower().startswith("cloudflare")
+    )
+
+def track_cloudflare_mitigation(page: Page) -> None:
+    """Classify every main-frame navigation response on the page as challenge or not."""
+    def on_response(response) -> None:
+        if response.request.is_navigation_request() and response.frame == page.main_frame:
+            _PAGE_CF_CHALLENGED[page] = is_cloudflare_challenge_response(response)
+
+    page.on("response", on_response)
+
+# Each mouse step is its own CDP Input.dispatchMouseEvent round trip.
+_MOUSE_MOVE_STEPS = (2, 3, 4)
+_MOUSE_MOVE_PROBABILITY = 0.5
 
 def human_mouse_move(page: Page):
     """
     Simulates small human-like mouse movements to trigger event listeners.
     """
+    # Skipping some nudges keeps the timing irregular, like a real user's hand
+    if random.random() >= _MOUSE_MOVE_PROBABILITY:
+        return
     try:
         # Move mouse to a random position in the center area
         x = random.randint(300, 800)
         y = random.randint(200, 600)
-        page.mouse.move(x, y, steps=10) # steps creates a 'drag' effect rather than teleport
-        time.sleep(random.uniform(0.1, 0.3))
+        page.mouse.move(x, y, steps=random.choice(_MOUSE_MOVE_STEPS)) # steps creates a 'drag' effect rather than teleport
+        page.wait_for_timeout(random.randint(100, 300))
     except Exception:
         pass
 
+_CF_RE = re.compile(r"verifying you are human|just a moment|checking (your browser|if the site)", re.I)
+# Polled inside the page by wait_for_function, over the title and the start of the visible
+# text where the interstitial's wording sits. _CF_RE's pattern is valid JavaScript too.
+_CLOUDFLARE_CLEARED_JS = (
+    "() => !/" + _CF_RE.pattern + "/i.test((document.title || '') + '\\n' + "
+    "(document.body ? document.body.innerText.slice(0, 512) : ''))"
+)
+_CLOUDFLARE_POLL_MS = 250
+# The sync API blocks in wait_for_function and cannot be driven from another thread, so the
+# wait runs in slices of this length with a mouse nudge in between.
+_CLOUDFLARE_MOUSE_MOVE_INTERVAL_MS = 1000
+
 def wait_for_cloudflare_to_clear(page: Page, timeout_ms=60000):
     """
     Waits for the 'Verifying you are human' or Turnstile widget to disappear.
@@ -186,21 +336,20 @@ def wait_for_cloudflare_to_clear(page: Page, timeout_ms=60000):
     deadline = time.time() + (timeout_ms / 1000)
     
     while time.time() < deadline:
-        # 1. Check if the challenge is still visible
+        # 1. Challenges come back as 403/503 from a cloudflare server or carry
+        # cf-mitigated; once the latest navigation is neither, skip the DOM scan.
+        if _PAGE_CF_CHALLENGED.get(page) is False:
+            return True
+
+        # 2. Otherwise let the browser poll until the challenge text is gone
+        slice_ms = max(1, min(_CLOUDFLARE_MOUSE_MOVE_INTERVAL_MS, int((deadline - time.time()) * 1000)))
         try:
-            # Check for common Turnstile/Cloudflare text
-            text_content = page.content().lower()
-            if "verifying you are human" not in text_content and "just a moment" not in text_content:
-                # 2. Check if we have access to a known element on the target site
-                # (Optional: Add a check for an element that SHOULD exist on the target page)
-                return True
-            
+            page.wait_for_function(_CLOUDFLARE_CLEARED_JS, timeout=slice_ms, polling=_CLOUDFLARE_POLL_MS)
+            return True
+        except PlaywrightTimeoutError:
             # 3. Simulate "nervous" user mouse movement while waiting
             human_mouse_move(page)
-            
         except Exception:
-            pass # Page might be navigating/closed
-            
-        time.sleep(1) # Wait between checks
+            time.sleep(_CLOUDFLARE_POLL_MS / 1000) # Page might be navigating/closed
         
     raise TimeoutError("Cloudflare interstitial did not clear")
@@ -1,55 +1,180 @@
 #!/usr/bin/env python3
 import json
-import urllib.request
-import urllib.error
-import ssl
+import re
+import socket
+import threading
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain, islice, zip_longest
 from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 
 INPUT_FILE = Path(__file__).parent / "remote_jobs.json"
 OUTPUT_FILE = Path(__file__).parent / "broken_links.txt"
+# Total in-flight checks, and the most any single host gets at once.
+MAX_WORKERS = 64
+MAX_CONNECTIONS_PER_HOST = 8
+# Entries are host-interleaved and submitted in windows of this size as the input is parsed.
+SUBMIT_WINDOW = MAX_WORKERS * 4
+# Whitespace and at most one comma between items of the input array.
+ARRAY_SEPARATOR_RE = re.compile(r"\s*,?\s*")
+
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# One keep-alive session for every check: most links live on a handful of ATS hosts,
+# so reusing pooled connections skips a TCP + TLS handshake per URL.
+session = requests.Session()
+session.verify = False
+session.headers.update({"User-Agent": "Mozilla/5.0"})
+# pool_block makes a worker wait for a free connection to its host instead of opening
+# an extra one, so a long run of same-host URLs cannot hammer that host.
+# pool_connections is how many host pools are kept; it covers every host a submit window
+# can interleave, so a host's pool is still warm when its next turn comes round.
+adapter = HTTPAdapter(
+    pool_connections=SUBMIT_WINDOW,
+    pool_maxsize=MAX_CONNECTIONS_PER_HOST,
+    pool_block=True,
+    max_retries=0,
+)
+session.mount("http://", adapter)
+session.mount("https://", adapter)
+
+# Many job boards reject HEAD with 403/405 while serving the page fine over GET.
+# Hosts seen doing that skip straight to a streamed GET for the rest of the run.
+HEAD_REJECTED_STATUSES = {403, 405}
+head_unsupported_hosts = set()
+head_unsupported_lock = threading.Lock()
 
-ctx = ssl.create_default_context()
-ctx.check_hostname = False
-ctx.verify_mode = ssl.CERT_NONE
+def fetch_status(method, url):
+    if method == "HEAD":
+        # HEAD has no body, so the connection goes straight back to the pool.
+        return session.head(url, timeout=10, allow_redirects=True).status_code
+    # stream=True skips downloading the page; closing the unread response drops its
+    # socket, which is the price of not reading the body.
+    response = session.request(method, url, timeout=10, allow_redirects=True, stream=True)
+    response.close()
+    return response.status_code
 
-def check_url(entry):
+# Resolver answers that mean the name really does not exist. Anything else (EAI_AGAIN
+# and friends) may be transient, so those hosts still get their HTTP checks.
+DNS_NOT_FOUND_ERRORS = {
+    code
+    for code in (getattr(socket, "EAI_NONAME", None), getattr(socket, "EAI_NODATA", None))
+    if code is not None
+}
+
+def resolve_host(hostname):
+    """Resolve once per host; returns the DNS error, or None once the system resolver is warm."""
+    if not hostname:
+        return None
+    try:
+        socket.getaddrinfo(hostname, 443, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        if e.errno in DNS_NOT_FOUND_ERRORS:
+            return f"DNS resolution failed: {e}"
+    return None
+
+def check_url(entry, dns_error=None):
     url = entry["url"]
     company = entry["company"]
+    if dns_error:
+        return (company, url, dns_error)
+    host = urlparse(url).netloc
     try:
-        req = urllib.request.Request(url, method="HEAD")
-        req.add_header("User-Agent", "Mozilla/5.0")
-        with urllib.request.urlopen(req, timeout=10, context=ctx) as response:
-            if response.status >= 400:
-                return (company, url, response.status)
-    except urllib.error.HTTPError as e:
-        return (company, url, e.code)
+        with head_unsupported_lock:
+            use_head = host not in head_unsupported_hosts
+
+        status = fetch_status("HEAD", url) if use_head else None
+        if status in HEAD_REJECTED_STATUSES:
+            with head_unsupported_lock:
+                head_unsupported_hosts.add(host)
+            status = None
+        if status is None:
+            status = fetch_status("GET", url)
+
+        if status >= 400:
+            return (company, url, status)
     except Exception as e:
         return (company, url, str(e))
     return None
 
+def iter_json_array(f, chunk_size=1 << 16):
+    """Yield the items of a top-level JSON array while the file is still being read."""
+    decoder = json.JSONDecoder()
+    buf = f.read(chunk_size).lstrip()
+    if not buf.startswith("["):
+        raise ValueError(f"{f.name} does not contain a JSON array")
+    idx = 1
+    eof = False
+    while True:
+        idx = ARRAY_SEPARATOR_RE.match(buf, idx).end()
+        if buf.startswith("]", idx):
+            return
+        try:
+            item, idx = decoder.raw_decode(buf, idx)
+        except json.JSONDecodeError:
+            # The next item is cut off at the end of the buffer; read more of it. Decoded
+            # items are dropped here, once per refill, rather than after every item.
+            if eof:
+                raise
+            more = f.read(chunk_size)
+            eof = not more
+            buf = buf[idx:] + more
+            idx = 0
+            continue
+        yield item
+
+def interleave_by_host(entries):
+    # Interleave hosts so the per-host cap never leaves most workers queued on one
+    # domain; pooled connections stay warm between that host's turns.
+    by_host = defaultdict(list)
+    for entry in entries:
+        by_host[urlparse(entry["url"]).netloc].append(entry)
+    return [
+        entry
+        for entry in chain.from_iterable(zip_longest(*by_host.values()))
+        if entry is not None
+    ]
+
 def main():
-    with open(INPUT_FILE) as f:
-        entries = json.load(f)
+    print(f"Checking links from {INPUT_FILE}...")
+    broken_count = 0
 
-    print(f"Checking {len(entries)} links...")
-    broken = []
+    # Broken links go straight to a buffered file as they come in rather than piling up in
+    # memory until the end.
+    with open(INPUT_FILE, encoding="utf-8") as f, \
+            open(OUTPUT_FILE, "w", buffering=1 << 16) as out, \
+            ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # Checks start as soon as the first window is parsed instead of after json.load.
+        entries = iter_json_array(f)
+        futures = []
+        # Each host is resolved once, concurrently, before its URLs are checked. Links on
+        # a host that does not resolve are reported without an HTTP attempt each.
+        dns_errors = {}
+        while window := list(islice(entries, SUBMIT_WINDOW)):
+            new_hosts = {urlparse(entry["url"]).hostname for entry in window} - dns_errors.keys()
+            dns_errors.update(zip(new_hosts, executor.map(resolve_host, new_hosts)))
+            futures.extend(
+                executor.submit(check_url, entry, dns_errors[urlparse(entry["url"]).hostname])
+                for entry in interleave_by_host(window)
+            )
+        total = len(futures)
 
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        futures = {executor.submit(check_url, entry): entry for entry in entries}
         for i, future in enumerate(as_completed(futures), 1):
             result = future.result()
             if result:
-                broken.append(result)
-                print(f"[{i}/{len(entries)}] BROKEN: {result[0]} -> {result[1]} ({result[2]})")
+                company, url, status = result
+                out.write(f"{url} | {status}\n")
+                broken_count += 1
+                print(f"[{i}/{total}] BROKEN: {company} -> {url} ({status})")
             else:
-                print(f"[{i}/{len(entries)}] OK")
-
-    with open(OUTPUT_FILE, "w") as f:
-        for company, url, status in broken:
-            f.write(f"{url} | {status}\n")
+                print(f"[{i}/{total}] OK")
 
-    print(f"\nFound {len(broken)} broken links. Saved to {OUTPUT_FILE}")
+    print(f"\nFound {broken_count} broken links. Saved to {OUTPUT_FILE}")
 
 if __name__ == "__main__":
     main()
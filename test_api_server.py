@@ -1,5 +1,7 @@
 """Unit tests for JobScout's bounded JobSpy API wrapper."""
 
+import asyncio
+import json
 import os
 import threading
 import time
@@ -11,6 +13,7 @@ from fastapi import HTTPException
 from pydantic import ValidationError
 
 import api_server
+from jobspy.model import JobPost
 
 
 class ApiServerTestCase(unittest.TestCase):
@@ -27,6 +30,8 @@ class ApiServerTestCase(unittest.TestCase):
         with api_server.JOB_STORE_LOCK:
             api_server.JOB_STORE.clear()
         api_server.SCRAPE_SEMAPHORE = threading.BoundedSemaphore(1)
+        with api_server.INFLIGHT_TASKS_LOCK:
+            api_server.INFLIGHT_TASKS.clear()
 
     def tearDown(self) -> None:
         self.environment.stop()
@@ -49,15 +54,24 @@ class ApiServerTestCase(unittest.TestCase):
                 display_name="UI-only source metadata",
             )
 
+    def test_request_parses_job_type_names_and_aliases(self) -> None:
+        by_name = api_server.ScrapeRequest(site_type=["tokyodev"], job_type="FULL_TIME")
+        by_alias = api_server.ScrapeRequest(site_type=["tokyodev"], job_type="Vollzeit")
+
+        self.assertIs(by_name.job_type, api_server.JobType.FULL_TIME)
+        self.assertIs(by_alias.job_type, api_server.JobType.FULL_TIME)
+        with self.assertRaises(ValidationError):
+            api_server.ScrapeRequest(site_type=["tokyodev"], job_type="sometimes")
+
     def test_authentication_requires_matching_token(self) -> None:
         with self.assertRaises(HTTPException) as missing:
-            api_server._require_api_token(None)
+            asyncio.run(api_server._require_api_token(None))
         self.assertEqual(missing.exception.status_code, 401)
 
         with self.assertRaises(HTTPException) as invalid:
-            api_server._require_api_token("wrong-token")
+            asyncio.run(api_server._require_api_token("wrong-token"))
         self.assertEqual(invalid.exception.status_code, 401)
-        self.assertIsNone(api_server._require_api_token("test-token"))
+        self.assertIsNone(asyncio.run(api_server._require_api_token("test-token")))
 
     def test_concurrency_slot_rejects_second_scrape(self) -> None:
         api_server._acquire_scrape_slot()
@@ -66,14 +80,39 @@ class ApiServerTestCase(unittest.TestCase):
         self.assertEqual(rejected.exception.status_code, 429)
         api_server.SCRAPE_SEMAPHORE.release()
 
-    def test_scraper_task_records_success_and_releases_slot(self) -> None:
-        class FakeJob:
-            def model_dump(self):
-                return {"id": "td-1", "title": "Engineer"}
+    def test_identical_requests_share_one_inflight_scrape(self) -> None:
+        request = api_server.ScrapeRequest(site_type=["tokyodev"], results_wanted=1)
+        same_request = api_server.ScrapeRequest(site_type=["tokyodev"], results_wanted=1)
+        other_request = api_server.ScrapeRequest(site_type=["tokyodev"], results_wanted=2)
+
+        with patch.object(api_server, "SCRAPE_EXECUTOR") as executor:
+            first = asyncio.run(api_server.submit_scrape_job(request))
+            joined = asyncio.run(api_server.submit_scrape_job(same_request))
+            with self.assertRaises(HTTPException) as rejected:
+                asyncio.run(api_server.submit_scrape_job(other_request))
+
+        self.assertEqual(joined["task_id"], first["task_id"])
+        self.assertEqual(rejected.exception.status_code, 429)
+        executor.submit.assert_called_once()
+
+        api_server._forget_inflight_task(first["task_id"])
+        api_server.SCRAPE_SEMAPHORE.release()
+        self.assertEqual(api_server.INFLIGHT_TASKS, {})
 
+    def test_scraper_task_records_success_and_releases_slot(self) -> None:
         class FakeScraper:
             def scrape(self, _request, **_options):
-                return SimpleNamespace(jobs=[FakeJob()])
+                return SimpleNamespace(
+                    jobs=[
+                        JobPost(
+                            id="td-1",
+                            title="Engineer",
+                            company_name=None,
+                            job_url="https://www.tokyodev.com/companies/example/jobs/engineer",
+                            location=None,
+                        )
+                    ]
+                )
 
         request = api_server.ScrapeRequest(site_type=["tokyodev"], results_wanted=1)
         api_server.SCRAPE_SEMAPHORE.acquire()
@@ -82,6 +121,13 @@ class ApiServerTestCase(unittest.TestCase):
 
         self.assertEqual(api_server.JOB_STORE["task-success"]["status"], "completed")
         self.assertEqual(api_server.JOB_STORE["task-success"]["count"], 1)
+        task = json.loads(api_server._task_json(api_server.JOB_STORE["task-success"]))
+        self.assertEqual(task["status"], "completed")
+        self.assertEqual(task["count"], 1)
+        self.assertEqual(
+            [(job["id"], job["title"]) for job in task["data"]],
+            [("td-1", "Engineer")],
+        )
         self.assertTrue(api_server.SCRAPE_SEMAPHORE.acquire(blocking=False))
         api_server.SCRAPE_SEMAPHORE.release()
 
@@ -132,6 +178,80 @@ class ApiServerTestCase(unittest.TestCase):
         finally:
             api_server.TASK_TTL_SECONDS = previous_ttl
 
+    def test_event_stream_pushes_the_terminal_task_state(self) -> None:
+        async def first_event() -> bytes:
+            api_server._store_task("task-events", status="processing")
+            stream = api_server._task_event_stream("task-events")
+            pending = asyncio.ensure_future(stream.__anext__())
+            await asyncio.sleep(0)
+            await asyncio.to_thread(
+                api_server._store_task, "task-events", status="failed", error="site unavailable"
+            )
+            try:
+                return await asyncio.wait_for(pending, timeout=1)
+            finally:
+                await stream.aclose()
+
+        event = asyncio.run(first_event())
+
+        self.assertTrue(event.startswith(b"data: "))
+        self.assertEqual(
+            json.loads(event[len(b"data: "):]),
+            {"status": "failed", "error": "site unavailable"},
+        )
+        self.assertNotIn("task-events", api_server.TASK_WAITERS)
+
+    def test_redis_store_round_trips_tasks_with_a_ttl(self) -> None:
+        class FakePipeline:
+            def __init__(self, redis, transaction) -> None:
+                self.redis = redis
+                self.transaction = transaction
+                self.pending: list[tuple[str, str, int]] = []
+
+            def set(self, key, value, ex=None):
+                self.pending.append((key, value, ex))
+
+            def execute(self):
+                self.redis.transactions.append(self.transaction)
+                for key, value, ex in self.pending:
+                    self.redis.values[key] = (value, ex)
+
+        class FakeRedis:
+            def __init__(self) -> None:
+                self.values: dict[str, tuple[str, int]] = {}
+                self.transactions: list[bool] = []
+
+            def pipeline(self, transaction=True):
+                return FakePipeline(self, transaction)
+
+            def mget(self, *keys):
+                return [
+                    self.values[key][0] if key in self.values else None
+                    for key in keys
+                ]
+
+        fake_redis = FakeRedis()
+        with patch.object(api_server, "TASK_REDIS", fake_redis):
+            api_server._store_task("shared", status="completed", count=0, data_json=b"[]")
+            task = api_server._load_task("shared")
+            self.assertIsNone(api_server._load_task("missing"))
+
+        self.assertEqual(task["status"], "completed")
+        self.assertEqual(fake_redis.transactions, [True])
+        self.assertEqual(
+            json.loads(api_server._task_json(task)),
+            {"status": "completed", "count": 0, "data": []},
+        )
+        self.assertEqual(
+            fake_redis.values["jobspy:task:shared"][1],
+            api_server.TASK_TTL_SECONDS,
+        )
+        self.assertEqual(
+            fake_redis.values["jobspy:task:shared:body"][1],
+            api_server.TASK_TTL_SECONDS,
+        )
+        self.assertNotIn("shared", api_server.JOB_STORE)
+
 
 if __name__ == "__main__":
     unittest.main()
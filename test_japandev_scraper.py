@@ -1,11 +1,32 @@
 import unittest
 from unittest.mock import Mock, patch
 
+from datetime import date
+
+from jobspy.model import DescriptionFormat, ScraperInput, Site
+from jobspy.scrapers import japandev
 from jobspy.scrapers.japandev import REQUEST_COMPLETION_BUFFER_SECONDS, JapanDev
 
 
+_DETAIL_HTML = """
+<h1 class="job-detail__job-name"> Backend Engineer </h1>
+<a class="job-logo__company-name">Example KK</a>
+<ul class="job-detail__summary-list">
+  <li><span>Tokyo</span></li>
+  <li><span>January 8, 2026</span></li>
+</ul>
+<div class="job-detail-tag-list__basic-tag">
+  <img alt="yen-icon">
+  <div class="job-detail-tag-list__tag-desc">8M 12M yr</div>
+</div>
+<a href="https://example.com/apply">APPLY NOW</a>
+<div class="job-detail-main-content"><div class="body"><p>Build APIs.</p></div></div>
+"""
+
+
 class _FilterOption:
     full_id = "seniority-junior"
+    selector = "[id='seniority-junior']"
 
 
 class JapanDevScraperTestCase(unittest.TestCase):
@@ -31,10 +52,148 @@ class JapanDevScraperTestCase(unittest.TestCase):
             expect.return_value.to_have_class.return_value = None
             JapanDev()._click_filter(page, _FilterOption())
 
+        page.locator.assert_called_once_with("[id='seniority-junior']")
         locator.wait_for.assert_called_once_with(state="visible", timeout=2000)
         locator.scroll_into_view_if_needed.assert_called_once_with(timeout=2000)
         locator.click.assert_called_once_with(force=False, no_wait_after=True, timeout=2000)
 
+    def test_salary_ranges_are_parsed_as_yearly_yen(self) -> None:
+        scraper = JapanDev()
+
+        comp = scraper._parse_salary_to_comp("8.5M 12M yr")
+        open_ended = scraper._parse_salary_to_comp("10M+")
+
+        self.assertEqual((comp.min_amount, comp.max_amount, comp.currency), (8_500_000, 12_000_000, "JPY"))
+        self.assertEqual((open_ended.min_amount, open_ended.max_amount), (10_000_000, None))
+        self.assertIsNone(scraper._parse_salary_to_comp("Competitive"))
+
+    def test_detail_fields_are_parsed_from_server_rendered_html(self) -> None:
+        scraper_input = ScraperInput(
+            site_type=[Site.JAPANDEV],
+            description_format=DescriptionFormat.HTML,
+        )
+
+        detail = JapanDev()._extract_detail_fields(_DETAIL_HTML, scraper_input)
+
+        self.assertEqual(detail["title"], "Backend Engineer")
+        self.assertEqual(detail["company_name"], "Example KK")
+        self.assertEqual(detail["location_text"], "Tokyo")
+        self.assertEqual(detail["date_posted"], date(2026, 1, 8))
+        self.assertEqual(detail["salary_text"], "8M 12M yr")
+        self.assertEqual(detail["job_url_direct"], "https://example.com/apply")
+        self.assertEqual(detail["description"], "<p>Build APIs.</p>")
+
+    def test_text_descriptions_keep_inline_markup_in_one_sentence(self) -> None:
+        html = _DETAIL_HTML.replace(
+            "<p>Build APIs.</p>",
+            "<p>We use <b>Python</b> and <a>Go</a> daily.</p>",
+        )
+
+        plain = JapanDev()._extract_detail_fields(
+            html,
+            ScraperInput(site_type=[Site.JAPANDEV], description_format=DescriptionFormat.PLAIN),
+        )
+        markdown = JapanDev()._extract_detail_fields(
+            html,
+            ScraperInput(site_type=[Site.JAPANDEV], description_format=DescriptionFormat.MARKDOWN),
+        )
+
+        self.assertEqual(plain["description"], "We use Python and Go daily.")
+        self.assertIn("We use **Python** and", markdown["description"])
+        self.assertNotIn("\n", markdown["description"])
+
+    def test_static_listing_cards_are_parsed_and_deduplicated(self) -> None:
+        html = """
+        <div class="job-item">
+          <img class="company-logo__inner" alt="Example KK">
+          <a class="job-item__title" href="/jobs/example/backend-engineer">Backend Engineer</a>
+        </div>
+        <div class="job-item">
+          <a class="job-item__title" href="/jobs/example/backend-engineer">Backend Engineer</a>
+        </div>
+        <div class="job-item"><a class="job-item__title">Missing link</a></div>
+        """
+
+        seeds = JapanDev()._parse_listing_html(html)
+
+        self.assertEqual(len(seeds), 1)
+        self.assertEqual(seeds[0].title, "Backend Engineer")
+        self.assertEqual(seeds[0].job_url, "https://japan-dev.com/jobs/example/backend-engineer")
+        self.assertEqual(seeds[0].company_name, "Example KK")
+
+    def test_static_listing_ignores_a_page_with_only_featured_jobs(self) -> None:
+        html = """
+        <div class="top-jobs__job-item">
+          <a class="title link" href="/jobs/example/featured-engineer">Featured Engineer</a>
+        </div>
+        """
+
+        self.assertEqual(JapanDev()._parse_listing_html(html), [])
+
+    def test_cached_detail_pages_are_not_fetched_again(self) -> None:
+        scraper = JapanDev()
+        scraper_input = ScraperInput(site_type=[Site.JAPANDEV], results_wanted=1)
+        seed = japandev._JobSeed(
+            "Backend Engineer",
+            "https://japan-dev.com/jobs/example/backend-engineer",
+            "Example KK",
+        )
+        session = Mock()
+        session.get.return_value.text = _DETAIL_HTML
+        japandev._DETAIL_CACHE.clear()
+        self.addCleanup(japandev._DETAIL_CACHE.clear)
+
+        deadline = JapanDev._request_deadline(30)
+        first = scraper._scrape_details(session, [seed], scraper_input, deadline)
+        second = scraper._scrape_details(session, [seed], scraper_input, deadline)
+
+        self.assertEqual(session.get.call_count, 1)
+        self.assertEqual([job.title for job in first + second], ["Backend Engineer"] * 2)
+
+    def test_detail_fetch_does_not_wait_out_a_retry_after_past_the_deadline(self) -> None:
+        session = Mock()
+        session.get.return_value.status_code = 429
+        session.get.return_value.headers = {"Retry-After": "120"}
+
+        with patch("jobspy.scrapers.japandev.time.monotonic", return_value=100.0), \
+            patch("jobspy.scrapers.japandev.time.sleep") as sleep:
+            with self.assertRaises(TimeoutError):
+                JapanDev._fetch_html(session, "https://japan-dev.com/jobs/a", 101.0)
+            with self.assertRaises(TimeoutError):
+                JapanDev._fetch_html(session, "https://japan-dev.com/jobs/a", 100.0)
+
+        self.assertEqual(session.get.call_count, 1)
+        sleep.assert_not_called()
+
+    def test_detail_fetch_retries_server_errors_within_the_deadline(self) -> None:
+        busy, ok = Mock(status_code=503, headers={}), Mock(status_code=200, text="<html></html>")
+        session = Mock()
+        session.get.side_effect = [busy, ok]
+
+        with patch("jobspy.scrapers.japandev.time.sleep") as sleep:
+            html = JapanDev._fetch_html(
+                session, "https://japan-dev.com/jobs/a", JapanDev._request_deadline(30)
+            )
+
+        self.assertEqual(html, "<html></html>")
+        sleep.assert_called_once_with(japandev.DETAIL_RETRY_BACKOFF_SECONDS)
+
+    def test_listing_cards_are_read_with_one_browser_evaluation(self) -> None:
+        page = Mock()
+        page.evaluate.return_value = [
+            {"title": "Backend Engineer", "href": "/jobs/example/backend", "company": "Example KK"},
+            {"title": None, "href": "/jobs/example/untitled", "company": None},
+        ]
+
+        seeds = JapanDev()._collect_job_seeds(page)
+
+        page.evaluate.assert_called_once()
+        page.locator.assert_not_called()
+        self.assertEqual(
+            seeds,
+            [japandev._JobSeed("Backend Engineer", "https://japan-dev.com/jobs/example/backend", "Example KK")],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,9 @@
 import unittest
+from contextlib import contextmanager
+from unittest.mock import Mock, patch
 
-from jobspy.scrapers.tokyodev import TokyoDev
+from jobspy.model import ScraperInput, Site
+from jobspy.scrapers.tokyodev import JobSeed, TokyoDev
 
 
 class _ListingLocator:
@@ -45,6 +48,34 @@ class TokyoDevScraperTestCase(unittest.TestCase):
         self.assertEqual(seeds[0].salary_text_hint, "¥8M ~ ¥12M")
         self.assertEqual(seeds[0].skills, ["Python"])
 
+    def test_failed_detail_page_is_replaced_before_the_next_job(self) -> None:
+        list_page, broken_page, fresh_page = Mock(), Mock(), Mock()
+        broken_page.goto.side_effect = TimeoutError("navigation timed out")
+        context = Mock()
+
+        @contextmanager
+        def fake_context(**kwargs):
+            yield context
+
+        seeds = [
+            JobSeed("https://www.tokyodev.com/jobs/first", "First Co", [], False, None, []),
+            JobSeed("https://www.tokyodev.com/jobs/second", "Second Co", [], False, None, []),
+        ]
+        with patch("jobspy.scrapers.tokyodev.managed_playwright_context", fake_context), \
+            patch(
+                "jobspy.scrapers.tokyodev.setup_page",
+                side_effect=[list_page, broken_page, fresh_page, Mock()],
+            ), \
+            patch("jobspy.scrapers.tokyodev.wait_for_cloudflare_to_clear"), \
+            patch("jobspy.scrapers.tokyodev.time.sleep"), \
+            patch.object(TokyoDev, "_extract_seeds_from_list_page", return_value=seeds):
+            TokyoDev().scrape(ScraperInput(site_type=[Site.TOKYODEV], results_wanted=2))
+
+        broken_page.close.assert_called_once_with()
+        self.assertEqual(broken_page.goto.call_count, 1)
+        fresh_page.goto.assert_called_once()
+        self.assertEqual(fresh_page.goto.call_args.args[0], "https://www.tokyodev.com/jobs/second")
+
 
 if __name__ == "__main__":
     unittest.main()